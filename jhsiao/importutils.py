@@ -1,46 +1,76 @@
 import os
-import pkgutil
-from importlib import import_module
-import traceback
 import sys
 
+__all__ = ['Condition', 'IsSubclass', 'find', 'find_many', 'get']
 
-def _itermodules(paths, prefix=''):
-    """Find possible modules on in dirs.
+# Namespace packages (no __init__.py) are importable since 3.3.
+_ALLOW_NAMESPACE_PKG = sys.version_info[:2] >= (3, 3)
+_MODULE_SUFFIXES = frozenset(('.py', '.pyc'))
+# Directory entry name without dots, except an optional .py/.pyc
+# suffix.  Compiled into _namematch on first use to avoid importing re.
+_NAME_PATTERN = r'(?P<base>[^.]+)(?:\.pyc?)?\Z'
+_namematch = None
 
-    paths: list of dirs to search.  If a file, use its dirname.
-    prefix: prefix for module name (name of parent package if any)
-    pkgutil docs say iter_modules might not be implemented.
-    """
-    if isinstance(paths, str):
-        paths = [paths]
+_LAZY = {
+    'import_module': ('importlib', 'import_module'),
+    'pkgutil': ('pkgutil', None),
+    'traceback': ('traceback', None),
+}
+
+def __getattr__(name):
+    """Lazily import names that used to be imported at module level."""
     try:
-        for path in paths:
-            if os.path.isfile(path):
-                path = os.path.dirname(path)
-            for _, name, ispkg in iter_modules(path, prefix):
-                yield name
-    except Exception:
-        # fallback to listdir
-        # .py/.pyc files, or packages, non-hidden
-        for path in paths:
-            path = os.path.abspath(os.path.normcase(path))
-            for fname in os.listdir(path):
-                name, ext = os.path.splitext(fname)
-                fullpath = os.path.join(path, fname)
-                if (
-                        fname.startswith('_')
-                        or (
-                            os.path.isfile(fullpath)
-                            and ext not in ('.py', '.pyc'))
-                        or (
-                            sys.version_info < (3,3)
-                            and not os.path.exists(
-                                os.path.join(fullpath, '__init__.py')))):
-                    continue
-                yield prefix+name
+        modname, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name))
+    from importlib import import_module
+    item = import_module(modname)
+    if attr is not None:
+        item = getattr(item, attr)
+    globals()[name] = item
+    return item
+
 
 class Condition(object):
+    """Filter modules and items for `find`.
+
+    Module candidates are given as `os.DirEntry`-like objects (with
+    `name`, `path`, `is_file()`, and `is_dir()`) so that the file type
+    is only looked up once per directory entry.
+    """
+    def is_module(self, entry):
+        """Return True if entry is a .py file or a .pyc without a .py."""
+        if not entry.is_file():
+            return False
+        name = entry.name
+        dot = name.rfind('.')
+        if dot < 0:
+            return False
+        suffix = name[dot:]
+        if suffix not in _MODULE_SUFFIXES:
+            return False
+        return suffix == '.py' or not os.path.isfile(entry.path[:-1])
+
+    def is_package(self, entry):
+        """Return True if entry is a package directory."""
+        return entry.is_dir() and (
+            _ALLOW_NAMESPACE_PKG
+            or os.path.isfile(os.path.join(entry.path, '__init__.py')))
+
+    def importable(self, entry):
+        """Return True if entry is a module or package."""
+        return self.is_module(entry) or self.is_package(entry)
+
+    def checkmod(self, module, entry):
+        """Return True if module (from entry) should be searched.
+
+        Default = all non-hidden importables.
+        """
+        return (
+            module.rpartition('.')[2][:1] != '_'
+            and self.importable(entry))
+
     def __call__(self, thing):
         """Return True if thing should be returned.
 
@@ -48,6 +78,73 @@ class Condition(object):
         """
         return True
 
+_DEFAULT_CONDITION = Condition()
+_DEFAULT_CHECKMOD = _DEFAULT_CONDITION.checkmod
+
+def _entryname(entry):
+    return entry.name
+
+def _itermodules(paths, condition=_DEFAULT_CONDITION, prefix=''):
+    """Find possible modules on in dirs.
+
+    paths: list of dirs to search.  If a file, use its dirname.
+    condition: Condition or callable(module, entry)
+        Used to filter module candidates found in directories.
+    prefix: prefix for module name (name of parent package if any)
+
+    Each module name is yielded at most once.
+    Directories are scanned directly with os.scandir.  Locations inside
+    a zip archive such as 'arch.zip/pkg' are passed to
+    pkgutil.iter_modules which has no directory entries to check so
+    only hidden names are skipped.  An archive file itself is a file, so
+    its dirname is scanned instead.  Other errors (missing paths,
+    permissions) are raised.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    paths = [
+        os.path.abspath(os.path.normcase(
+            os.path.dirname(path) if os.path.isfile(path) else path))
+        for path in paths]
+    if condition is _DEFAULT_CONDITION:
+        checkmod = _DEFAULT_CHECKMOD
+    else:
+        checkmod = getattr(condition, 'checkmod', condition)
+    global _namematch
+    if _namematch is None:
+        import re
+        _namematch = re.compile(_NAME_PATTERN).match
+    namematch = _namematch
+    seen = set()
+    _seen_add = seen.add
+    for path in paths:
+        try:
+            it = os.scandir(path)
+        except NotADirectoryError:
+            # Location inside a file such as a zip archive.
+            from pkgutil import iter_modules
+            for _, name, ispkg in iter_modules([path], prefix):
+                if (
+                        name not in seen
+                        and name.rpartition('.')[2][:1] != '_'):
+                    _seen_add(name)
+                    yield name
+            continue
+        # Drop '_' names before sorting so they are never classified.
+        with it:
+            entries = sorted(
+                [entry for entry in it if entry.name[:1] != '_'],
+                key=_entryname)
+        # .py/.pyc files, or packages, single name component
+        for entry in entries:
+            m = namematch(entry.name)
+            if m is None:
+                continue
+            candidate = prefix + m.group('base')
+            if candidate not in seen and checkmod(candidate, entry):
+                _seen_add(candidate)
+                yield candidate
+
 class IsSubclass(Condition):
     def __init__(self, baseclass):
         self.base = baseclass
@@ -58,35 +155,143 @@ class IsSubclass(Condition):
         except Exception:
             return False
 
-def find(paths, condition=Condition(), prefix=''):
+def _moditems(module, name, log):
+    """Return a list of (key, item) to search in module.
+
+    If module defines an __all__, only use those items.  Otherwise, use
+    the module's globals that do not start with '_'.
+    """
+    keys = getattr(module, '__all__', None)
+    if keys is None:
+        return [item for item in vars(module).items() if item[0][:1] != '_']
+    items = []
+    seen = set()
+    for k in keys:
+        if k in seen:
+            continue
+        seen.add(k)
+        try:
+            items.append((k, getattr(module, k)))
+        except Exception:
+            log.debug('__all__ item failed: %s.%s', name, k, exc_info=True)
+    return items
+
+# condition: {module name: (weakref to module, number of module
+# globals, found items)}, see `find`.
+_find_cache = None
+_FIND_CACHE_SIZE = 256
+
+def find(paths, condition=_DEFAULT_CONDITION, prefix=''):
     """Search for subclasses of base.
 
+    Results are cached per condition, including the default one.  See
+    below for when cached results are reused.
+
     paths: a str or seq of strs
     condition: callable(name, obj)
         Return True/False if 
+        If it has a `checkmod` method, it is also used to filter
+        modules (see `Condition.checkmod`).  Otherwise, the default
+        `Condition.checkmod` is used.
 
     If module defines an __all__, only search those items.
-    Otherwise, use `dir()`
+    Otherwise, search the module's globals that do not start with '_'.
+    Modules that fail to import and items that raise are skipped and
+    logged at DEBUG level on this module's logger.
+    Results are cached per (module, condition) and reused while the
+    condition is alive, the module in sys.modules is unchanged, and the
+    module has the same number of globals (up to `_FIND_CACHE_SIZE`
+    modules per condition).  Conditions and modules are only weakly
+    referenced, so pass the same condition instance to benefit.
+    Rebinding an existing module attribute is not noticed, so results
+    can be stale.  Use `find.cache_clear()` to reset.
     """
+    global _find_cache
+    from importlib import import_module
+    import logging
+    import weakref
+    log = logging.getLogger(__name__)
+    _sys_modules = sys.modules
+    _import = import_module
     if prefix and not prefix.endswith('.'):
         prefix += '.'
-    for name in _itermodules(paths, prefix):
+    if not hasattr(condition, 'checkmod'):
+        modcondition = _DEFAULT_CONDITION
+    else:
+        modcondition = condition
+    if _find_cache is None:
+        _find_cache = weakref.WeakKeyDictionary()
+    try:
+        modcache = _find_cache.get(condition)
+        if modcache is None:
+            modcache = _find_cache[condition] = {}
+    except TypeError:
+        # Not weakly referenceable or not hashable, don't cache.
+        modcache = None
+    for name in _itermodules(paths, modcondition, prefix):
         try:
-            module = import_module(name)
+            module = _sys_modules.get(name) or _import(name)
         except Exception:
-            traceback.print_exc()
+            log.debug('import failed: %s', name, exc_info=True)
             continue
-        try:
-            keys = module.__all__
-        except AttributeError:
-            keys = dir(module)
-        for k in keys:
+        if modcache is not None:
+            cached = modcache.get(name)
+            if (
+                    cached is not None
+                    and cached[0]() is module
+                    and cached[1] == len(vars(module))):
+                for item in cached[2]:
+                    yield item
+                continue
+        items = _moditems(module, name, log)
+        found = []
+        for k, thing in items:
             try:
-                thing = getattr(module, k)
-                if condition(thing):
-                    yield k, thing
+                if not condition(thing):
+                    continue
             except Exception:
-                traceback.print_exc()
+                log.debug('condition failed: %s.%s', name, k, exc_info=True)
+                continue
+            found.append((k, thing))
+            yield k, thing
+        if modcache is not None and (
+                name in modcache or len(modcache) < _FIND_CACHE_SIZE):
+            modcache[name] = (
+                weakref.ref(module), len(vars(module)), tuple(found))
+
+def _find_cache_clear():
+    """Clear cached `find` results."""
+    if _find_cache is not None:
+        _find_cache.clear()
+
+find.cache_clear = _find_cache_clear
+
+_SPEC_CACHE_SIZE = 256
+_spec_cache = {}
+
+def _parse_spec(spec, translate_items):
+    """Parse a `get` spec into (modname, tuple of attribute names).
+
+    translate_items: hashable items of the translate dict.
+    Results are memoized in `_spec_cache`, which is emptied when it
+    reaches `_SPEC_CACHE_SIZE` entries.
+    """
+    key = (spec, translate_items)
+    try:
+        return _spec_cache[key]
+    except KeyError:
+        pass
+    translate = dict(translate_items)
+    parts = spec.split(':', 1)
+    modname = '.'.join(translate.get(_, _) for _ in parts[0].split('.'))
+    if len(parts) > 1 and parts[1]:
+        result = modname, tuple(parts[1].split('.'))
+    else:
+        result = modname, ()
+    if len(_spec_cache) >= _SPEC_CACHE_SIZE:
+        _spec_cache.clear()
+    _spec_cache[key] = result
+    return result
 
 def get(spec, translate={'np': 'numpy'}):
     """Import an item.
@@ -101,10 +306,71 @@ def get(spec, translate={'np': 'numpy'}):
         is omitted, then assume the items portion is empty, resulting
         in just returning the module.
     """
-    parts = spec.split(':', 1)
-    modname = '.'.join(translate.get(_, _) for _ in parts[0].split('.'))
+    from importlib import import_module
+    _getattr = getattr
+    modname, chain = _parse_spec(spec, frozenset(translate.items()))
     item = import_module(modname)
-    if len(parts) > 1 and parts[1]:
-        for name in parts[1].split('.'):
-            item = getattr(item, name)
+    for name in chain:
+        item = _getattr(item, name)
     return item
+
+def find_many(paths, conditions, prefix=''):
+    """Search for items matching each of several conditions.
+
+    paths: a str or seq of strs
+    conditions: seq of conditions as for `find`.
+    prefix: prefix for module name (name of parent package if any)
+
+    Like calling `find` once per condition, but the paths are scanned
+    and each module is imported and enumerated only once.  A module is
+    searched if any condition's checkmod accepts any of its entries
+    and its items are only checked against the conditions that accepted
+    it.  The whole scan completes before any module is imported.
+
+    Return a dict of condition: list of (key, item).
+    """
+    from importlib import import_module
+    import logging
+    log = logging.getLogger(__name__)
+    _sys_modules = sys.modules
+    _import = import_module
+    if prefix and not prefix.endswith('.'):
+        prefix += '.'
+    conditions = list(dict.fromkeys(conditions))
+    out = {condition: [] for condition in conditions}
+    checkmods = [
+        (condition, getattr(condition, 'checkmod', _DEFAULT_CHECKMOD))
+        for condition in conditions]
+    # module name: set of conditions whose checkmod accepted any entry.
+    accepted = {}
+    def checkmod(module, entry):
+        conds = accepted.get(module)
+        for cond, check in checkmods:
+            if (conds is None or cond not in conds) and check(module, entry):
+                if conds is None:
+                    conds = accepted[module] = set()
+                conds.add(cond)
+        # Never accept so other entries with the same name (foo/ and
+        # foo.py) are still checked by the remaining conditions.
+        return False
+    # Only names from pkgutil are yielded, they have no entry to check.
+    for name in _itermodules(paths, checkmod, prefix):
+        accepted[name] = set(conditions)
+    for name, conds in accepted.items():
+        try:
+            module = _sys_modules.get(name) or _import(name)
+        except Exception:
+            log.debug('import failed: %s', name, exc_info=True)
+            continue
+        conds = [condition for condition in conditions if condition in conds]
+        for k, thing in _moditems(module, name, log):
+            for condition in conds:
+                try:
+                    if not condition(thing):
+                        continue
+                except Exception:
+                    log.debug(
+                        'condition failed: %s.%s', name, k, exc_info=True)
+                    continue
+                out[condition].append((k, thing))
+    return out
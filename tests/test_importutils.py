@@ -0,0 +1,60 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from jhsiao import importutils
+
+
+class ModulesOnly(importutils.Condition):
+    def checkmod(self, module, entry):
+        return self.is_module(entry)
+
+class PackagesOnly(importutils.Condition):
+    def checkmod(self, module, entry):
+        return self.is_package(entry)
+
+
+class TestFindMany(unittest.TestCase):
+    pkgname = '_jhsiao_importutils_findmany'
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.pkgdir = os.path.join(self.root, self.pkgname)
+        os.makedirs(os.path.join(self.pkgdir, 'foo'))
+        files = {
+            '__init__.py': '',
+            os.path.join('foo', '__init__.py'): 'Y = 1\n',
+            'foo.py': 'X = 1\n',
+            'bar.py': 'Z = 1\n',
+        }
+        for fname, text in files.items():
+            with open(os.path.join(self.pkgdir, fname), 'w') as f:
+                f.write(text)
+        sys.path.insert(0, self.root)
+
+    def tearDown(self):
+        sys.path.remove(self.root)
+        for name in list(sys.modules):
+            if name.split('.', 1)[0] == self.pkgname:
+                del sys.modules[name]
+        importutils.find.cache_clear()
+        shutil.rmtree(self.root)
+
+    def test_matches_find_per_condition(self):
+        modules, packages = ModulesOnly(), PackagesOnly()
+        result = importutils.find_many(
+            self.pkgdir, [modules, packages], self.pkgname)
+        # foo/ shadows foo.py on import, but foo.py still makes the
+        # modules-only condition search foo.
+        self.assertEqual(result[modules], [('Z', 1), ('Y', 1)])
+        self.assertEqual(result[packages], [('Y', 1)])
+        for condition in (modules, packages):
+            self.assertEqual(
+                result[condition],
+                list(importutils.find(self.pkgdir, condition, self.pkgname)))
+
+
+if __name__ == '__main__':
+    unittest.main()